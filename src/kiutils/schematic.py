@@ -258,70 +258,15 @@ class Schematic():
         else:
             expression += f'{indents}  (lib_symbols)\n'
 
-        if self.junctions:
-            expression += '\n'
-            for item in self.junctions:
-                expression += item.to_sexpr(indent+2)
-
-        if self.noConnects:
-            expression += '\n'
-            for item in self.noConnects:
-                expression += item.to_sexpr(indent+2)
-
-        if self.busEntries:
-            expression += '\n'
-            for item in self.busEntries:
-                expression += item.to_sexpr(indent+2)
-
-        if self.busAliases:
-            expression += '\n'
-            for item in self.busAliases:
-                expression += item.to_sexpr(indent+2)
-
-        if self.graphicalItems:
-            expression += '\n'
-            for item in self.graphicalItems:
-                expression += item.to_sexpr(indent+2)
-
-        if self.shapes:
-            expression += '\n'
-            for item in self.shapes:
-                expression += item.to_sexpr(indent+2)
-
-        if self.images:
-            expression += '\n'
-            for item in self.images:
-                expression += item.to_sexpr(indent+2)
-
-        if self.textBoxes:
-            expression += '\n'
-            for item in self.textBoxes:
-                expression += item.to_sexpr(indent+2)
-
-        if self.texts:
-            expression += '\n'
-            for item in self.texts:
-                expression += item.to_sexpr(indent+2)
-
-        if self.labels:
-            expression += '\n'
-            for item in self.labels:
-                expression += item.to_sexpr(indent+2)
-
-        if self.globalLabels:
-            expression += '\n'
-            for item in self.globalLabels:
-                expression += item.to_sexpr(indent+2)
-
-        if self.hierarchicalLabels:
-            expression += '\n'
-            for item in self.hierarchicalLabels:
-                expression += item.to_sexpr(indent+2)
-
-        if self.netclassFlags:
-            expression += '\n'
-            for item in self.netclassFlags:
-                expression += item.to_sexpr(indent+2)
+        # Item sections that are each preceded by an empty line when not empty
+        for section in (self.junctions, self.noConnects, self.busEntries, self.busAliases,
+                        self.graphicalItems, self.shapes, self.images, self.textBoxes, self.texts,
+                        self.labels, self.globalLabels, self.hierarchicalLabels,
+                        self.netclassFlags):
+            if section:
+                expression += '\n'
+                for item in section:
+                    expression += item.to_sexpr(indent+2)
 
         if self.schematicSymbols:
             for item in self.schematicSymbols:
@@ -3,6 +3,7 @@
 # Originally taken from: https://gitlab.com/kicad/libraries/kicad-library-utils/-/blob/master/common/sexpr.py
 
 import re
+import sys
 
 dbg = False
 
@@ -15,12 +16,19 @@ term_regex = r'''(?mx)
         (?P<s>[^(^)\s]+)
        )'''
 
+term_pattern = re.compile(term_regex)
+
 def parse_sexp(sexp):
     stack = []
     out = []
+    # Values such as layer or net names repeat throughout a file, so equal strings are shared
+    # within one parse instead of each being kept as a separate object
+    strings = {}
     if dbg: print("%-6s %-14s %-44s %-s" % tuple("term value out stack".split()))
-    for termtypes in re.finditer(term_regex, sexp):
-        term, value = [(t,v) for t,v in termtypes.groupdict().items() if v][0]
+    for termtypes in term_pattern.finditer(sexp):
+        # Exactly one named alternative matches per token, so it is always the last group
+        term = termtypes.lastgroup
+        value = termtypes.group(term)
         if dbg: print("%-7s %-14s %-44r %-r" % (term, value, out, stack))
         if   term == 'brackl':
             stack.append(out)
@@ -34,9 +42,16 @@ def parse_sexp(sexp):
             if v.is_integer(): v = int(v)
             out.append(v)
         elif term == 'sq':
-            out.append(value[1:-1].replace(r'\"', '"'))
+            value = value[1:-1].replace(r'\"', '"')
+            out.append(strings.setdefault(value, value))
         elif term == 's':
-            out.append(value)
+            # Only the first atom of a list is a token name compared against in from_sexpr(), so
+            # only that one is interned. Other unquoted atoms (UUIDs, layer names, flags, ..) are
+            # file data and would otherwise be kept alive for the whole process on some runtimes
+            if not out:
+                out.append(sys.intern(value))
+            else:
+                out.append(strings.setdefault(value, value))
         else:
             raise NotImplementedError("Error: %r" % (term, value))
     assert not stack, "Trouble with nesting of brackets"